@@ -78,7 +78,10 @@ impl PydanticUndefinedType {
         self.__copy__(py)
     }
 
-    fn __reduce__(&self) -> &'static str {
-        "PydanticUndefined"
+    fn __reduce__<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyTuple>> {
+        // return the `new` factory directly so unpickling calls it, instead of returning a
+        // global name string that pickle has to resolve via a module attribute lookup
+        let factory = py.get_type::<Self>().getattr("new")?;
+        PyTuple::new(py, [factory, PyTuple::empty(py).into_any()])
     }
 }
@@ -7,12 +7,13 @@ import re
 import sys
 import types
 import typing
-from functools import partial
+from functools import lru_cache, partial
 from inspect import Signature, signature
 from typing import TYPE_CHECKING, Any, Callable, cast
 
 import typing_extensions
-from typing_extensions import deprecated, get_args, get_origin
+from typing_extensions import deprecated, get_args
+from typing_extensions import get_origin as _uncached_get_origin
 from typing_inspection import typing_objects
 from typing_inspection.introspection import is_union_origin
 
@@ -40,6 +41,33 @@ if TYPE_CHECKING:
 # docs for performance).
 
 
+@lru_cache(maxsize=256)
+def _cached_get_origin(tp_type: type[Any], tp: Any, /) -> Any:
+    return _uncached_get_origin(tp)
+
+
+def get_origin(tp: Any, /) -> Any:
+    """A cached version of `typing_extensions.get_origin`, as the origin of an
+    annotation is fetched repeatedly during schema generation.
+
+    The cache is bounded so dynamically created parametrizations aren't kept
+    alive indefinitely.
+    """
+    if isinstance(tp, type):
+        # Plain classes (including parametrized generic models) resolve quickly and are
+        # deliberately left uncached so the cache never keeps user classes alive
+        # (e.g. entries of the weak-value generic types cache):
+        return _uncached_get_origin(tp)
+    try:
+        # the key includes the concrete type of `tp`, as forms that compare (and hash)
+        # equal can still have different origins — e.g. `int | str == Union[int, str]`,
+        # but their origins are `types.UnionType` and `typing.Union` respectively:
+        return _cached_get_origin(type(tp), tp)
+    except TypeError:
+        # e.g. `Annotated` forms with unhashable metadata can't be used as a cache key:
+        return _uncached_get_origin(tp)
+
+
 _t_annotated = typing.Annotated
 _te_annotated = typing_extensions.Annotated
 
@@ -7,6 +7,7 @@ from __future__ import annotations as _annotations
 
 import dataclasses
 import keyword
+import operator
 import sys
 import warnings
 import weakref
@@ -16,7 +17,7 @@ from collections.abc import Set as AbstractSet
 from copy import deepcopy
 from functools import cached_property
 from inspect import Parameter
-from itertools import zip_longest
+from itertools import starmap, zip_longest
 from types import BuiltinFunctionType, CodeType, FunctionType, GeneratorType, LambdaType, ModuleType
 from typing import TYPE_CHECKING, Any, Generic, TypeVar, overload
 
@@ -133,11 +134,19 @@ KeyType = TypeVar('KeyType')
 def deep_update(mapping: dict[KeyType, Any], *updating_mappings: dict[KeyType, Any]) -> dict[KeyType, Any]:
     updated_mapping = mapping.copy()
     for updating_mapping in updating_mappings:
-        for k, v in updating_mapping.items():
-            if k in updated_mapping and isinstance(updated_mapping[k], dict) and isinstance(v, dict):
-                updated_mapping[k] = deep_update(updated_mapping[k], v)
-            else:
-                updated_mapping[k] = v
+        # iterate with an explicit stack instead of recursing, copying a subtree
+        # only when the update actually descends into it:
+        stack: list[tuple[dict[KeyType, Any], dict[KeyType, Any]]] = [(updated_mapping, updating_mapping)]
+        while stack:
+            target, update = stack.pop()
+            for k, v in update.items():
+                target_v = target.get(k)
+                if isinstance(target_v, dict) and isinstance(v, dict):
+                    target_v = target_v.copy()
+                    target[k] = target_v
+                    stack.append((target_v, v))
+                else:
+                    target[k] = v
     return updated_mapping
 
 
@@ -157,17 +166,13 @@ def unique_list(
     We update the list if another one with the same name is set
     (e.g. model validator overridden in subclass).
     """
-    result: list[T] = []
-    result_names: list[str] = []
+    result: dict[str, T] = {}
     for v in input_list:
-        v_name = name_factory(v)
-        if v_name not in result_names:
-            result_names.append(v_name)
-            result.append(v)
-        else:
-            result[result_names.index(v_name)] = v
+        # dicts preserve the insertion order of the first occurrence while
+        # assignment replaces the value, so duplicates are updated in place:
+        result[name_factory(v)] = v
 
-    return result
+    return list(result.values())
 
 
 class ValueItems(_repr.Representation):
@@ -232,11 +237,10 @@ class ValueItems(_repr.Representation):
         if not all_items:
             return normalized_items
         if self.is_true(all_items):
-            for i in range(v_length):
-                normalized_items.setdefault(i, ...)
-            return normalized_items
+            # keep explicitly listed indexes as-is and fill the remaining ones with `...` in one pass:
+            return {**normalized_items, **{i: ... for i in range(v_length) if i not in normalized_items}}
         for i in range(v_length):
-            normalized_item = normalized_items.setdefault(i, {})
+            normalized_item = normalized_items.get(i, {})
             if not self.is_true(normalized_item):
                 normalized_items[i] = self.merge(all_items, normalized_item)
         return normalized_items
@@ -267,9 +271,9 @@ class ValueItems(_repr.Representation):
 
         # intersection or union of keys while preserving ordering:
         if intersect:
-            merge_keys = [k for k in base if k in override] + [k for k in override if k in base]
+            merge_keys: Iterable[int | str] = (k for k in base if k in override)
         else:
-            merge_keys = list(base) + [k for k in override if k not in base]
+            merge_keys = dict.fromkeys([*base, *override])
 
         merged: dict[int | str, Any] = {}
         for k in merge_keys:
@@ -281,6 +285,13 @@ class ValueItems(_repr.Representation):
 
     @staticmethod
     def _coerce_items(items: AbstractSetIntStr | MappingIntStrAny) -> MappingIntStrAny:
+        # fast path on the exact type first — in practice include/exclude values are
+        # plain dicts and sets, sparing the ABC isinstance checks:
+        items_type = type(items)
+        if items_type is dict:
+            return items  # type: ignore
+        if items_type is set or items_type is frozenset:
+            return dict.fromkeys(items, ...)  # type: ignore
         if isinstance(items, Mapping):
             pass
         elif isinstance(items, AbstractSet):
@@ -320,6 +331,12 @@ else:
             self.name = name
             self.get_value = get_value
 
+        def __set_name__(self, owner: type[Any], name: str) -> None:
+            # Keeps the attribute name in sync when the descriptor is assigned in a class body.
+            # The explicit `name` argument remains for the common case of assignment after class
+            # creation (e.g. `cls.__signature__ = ...`), where `__set_name__` is never invoked:
+            self.name = name
+
         @cached_property
         def value(self) -> Any:
             return self.get_value()
@@ -333,6 +350,28 @@ else:
 Obj = TypeVar('Obj')
 
 
+def _identity(obj: Any) -> Any:
+    return obj  # obj is immutable and not a collection, therefore will not be copied anyway
+
+
+def _copy_if_empty(obj: Any) -> Any:
+    # faster way for empty collections, no need to copy its members:
+    return obj.copy() if not obj else deepcopy(obj)
+
+
+def _copy_if_empty_tuple(obj: Any) -> Any:
+    return obj if not obj else deepcopy(obj)  # tuple doesn't have a copy method
+
+
+# maps exact types to the cheapest copy strategy, avoiding an `isinstance`/membership
+# chain per call; unknown types fall through to `deepcopy()`:
+_SMART_DEEPCOPY_HANDLERS: dict[type[Any], Callable[[Any], Any]] = {
+    **dict.fromkeys(IMMUTABLE_NON_COLLECTIONS_TYPES, _identity),
+    **dict.fromkeys(BUILTIN_COLLECTIONS, _copy_if_empty),
+    tuple: _copy_if_empty_tuple,
+}
+
+
 def smart_deepcopy(obj: Obj) -> Obj:
     """Return type as is for immutable built-in types
     Use obj.copy() for built-in empty collections
@@ -340,16 +379,9 @@ def smart_deepcopy(obj: Obj) -> Obj:
     """
     if obj is MISSING:
         return obj  # pyright: ignore[reportReturnType]
-    obj_type = obj.__class__
-    if obj_type in IMMUTABLE_NON_COLLECTIONS_TYPES:
-        return obj  # fastest case: obj is immutable and not collection therefore will not be copied anyway
-    try:
-        if not obj and obj_type in BUILTIN_COLLECTIONS:
-            # faster way for empty collections, no need to copy its members
-            return obj if obj_type is tuple else obj.copy()  # tuple doesn't have copy method  # type: ignore
-    except (TypeError, ValueError, RuntimeError):
-        # do we really dare to catch ALL errors? Seems a bit risky
-        pass
+    handler = _SMART_DEEPCOPY_HANDLERS.get(obj.__class__)
+    if handler is not None:
+        return handler(obj)
 
     return deepcopy(obj)  # slowest way when we actually might need a deepcopy
 
@@ -366,10 +398,8 @@ def all_identical(left: Iterable[Any], right: Iterable[Any]) -> bool:
     >>> all_identical([a, b, [a]], [a, b, [a]])  # new list object, while "equal" is not "identical"
     False
     """
-    for left_item, right_item in zip_longest(left, right, fillvalue=_SENTINEL):
-        if left_item is not right_item:
-            return False
-    return True
+    # `all` short-circuits on the first non-identical pair, with the whole loop running in C:
+    return all(starmap(operator.is_, zip_longest(left, right, fillvalue=_SENTINEL)))
 
 
 def get_first_not_none(a: Any, b: Any) -> Any:
@@ -8,6 +8,12 @@ __all__ = ('to_pascal', 'to_camel', 'to_snake')
 # Generally, don't only convert from snake_case, or name the functions
 # more specifically like snake_to_camel.
 
+# Remove an underscore sandwiched between alphanumerics (zero-width context, so `sub('')` needs no callback):
+_SANDWICHED_UNDERSCORE_RE = re.compile('(?<=[0-9A-Za-z])_(?=[0-9A-Z])')
+_ALREADY_CAMEL_RE = re.compile('^[a-z]+[A-Za-z0-9]*$')
+_DIGIT_LOWER_RE = re.compile(r'\d[a-z]')
+_LEADING_UPPER_RE = re.compile('^_*[A-Z]')
+
 
 def to_pascal(snake: str) -> str:
     """Convert a snake_case string to PascalCase.
@@ -18,8 +24,7 @@ def to_pascal(snake: str) -> str:
     Returns:
         The PascalCase string.
     """
-    camel = snake.title()
-    return re.sub('([0-9A-Za-z])_(?=[0-9A-Z])', lambda m: m.group(1), camel)
+    return _SANDWICHED_UNDERSCORE_RE.sub('', snake.title())
 
 
 def to_camel(snake: str) -> str:
@@ -33,11 +38,20 @@ def to_camel(snake: str) -> str:
     """
     # If the string is already in camelCase and does not contain a digit followed
     # by a lowercase letter, return it as it is
-    if re.match('^[a-z]+[A-Za-z0-9]*$', snake) and not re.search(r'\d[a-z]', snake):
+    if _ALREADY_CAMEL_RE.match(snake) and not _DIGIT_LOWER_RE.search(snake):
         return snake
 
     camel = to_pascal(snake)
-    return re.sub('(^_*[A-Z])', lambda m: m.group(1).lower(), camel)
+    return _LEADING_UPPER_RE.sub(lambda m: m.group(0).lower(), camel)
+
+
+# Compiled once at import time, as `to_snake` is typically called for every field of a model.
+# Handle the sequence of uppercase letters followed by a lowercase letter:
+_UPPER_RUN_RE = re.compile(r'([A-Z]+)([A-Z][a-z])')
+# Insert an underscore between a lowercase letter or digit and an uppercase letter:
+_LOWER_OR_DIGIT_UPPER_RE = re.compile(r'([a-z0-9])([A-Z])')
+# Insert an underscore between a lowercase letter and a digit:
+_LOWER_DIGIT_RE = re.compile(r'([a-z])([0-9])')
 
 
 def to_snake(camel: str) -> str:
@@ -49,14 +63,9 @@ def to_snake(camel: str) -> str:
     Returns:
         The converted string in snake_case.
     """
-    # Handle the sequence of uppercase letters followed by a lowercase letter
-    snake = re.sub(r'([A-Z]+)([A-Z][a-z])', lambda m: f'{m.group(1)}_{m.group(2)}', camel)
-    # Insert an underscore between a lowercase letter and an uppercase letter
-    snake = re.sub(r'([a-z])([A-Z])', lambda m: f'{m.group(1)}_{m.group(2)}', snake)
-    # Insert an underscore between a digit and an uppercase letter
-    snake = re.sub(r'([0-9])([A-Z])', lambda m: f'{m.group(1)}_{m.group(2)}', snake)
-    # Insert an underscore between a lowercase letter and a digit
-    snake = re.sub(r'([a-z])([0-9])', lambda m: f'{m.group(1)}_{m.group(2)}', snake)
+    snake = _UPPER_RUN_RE.sub(r'\1_\2', camel)
+    snake = _LOWER_OR_DIGIT_UPPER_RE.sub(r'\1_\2', snake)
+    snake = _LOWER_DIGIT_RE.sub(r'\1_\2', snake)
     # Replace hyphens with underscores to handle kebab-case
     snake = snake.replace('-', '_')
     return snake.lower()
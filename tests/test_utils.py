@@ -57,49 +57,49 @@ class LoggedVar(Generic[T]):
     def get(self) -> T: ...
 
 
-@pytest.mark.parametrize(
-    'value,expected',
-    [
-        (str, 'str'),
-        ('foobar', 'str'),
-        ('SomeForwardRefString', 'str'),  # included to document current behavior; could be changed
-        (Union[str, int], 'Union[str, int]'),
-        (list, 'list'),
-        ([1, 2, 3], 'list'),
-        (list[dict[str, int]], 'list[dict[str, int]]'),
-        (tuple[str, int, float], 'tuple[str, int, float]'),
-        (tuple[str, ...], 'tuple[str, ...]'),
-        (Union[int, list[str], tuple[str, int]], 'Union[int, list[str], tuple[str, int]]'),
-        (foobar, 'foobar'),
-        (time.time_ns, 'time_ns'),
-        (LoggedVar, 'LoggedVar'),
-        (LoggedVar(), 'LoggedVar'),
-    ],
-)
-def test_display_as_type(value, expected):
-    assert _repr.display_as_type(value) == expected
+# checked in a single test rather than one parametrized case per entry, as the
+# pytest per-item overhead dwarfs the cost of a `display_as_type` call. Values are
+# wrapped in factories (as in `test_display_as_type_310` below) so the generic
+# alias objects are only built when the test actually runs:
+def test_display_as_type():
+    cases = [
+        (lambda: str, 'str'),
+        (lambda: 'foobar', 'str'),
+        (lambda: 'SomeForwardRefString', 'str'),  # included to document current behavior; could be changed
+        (lambda: Union[str, int], 'Union[str, int]'),
+        (lambda: list, 'list'),
+        (lambda: [1, 2, 3], 'list'),
+        (lambda: list[dict[str, int]], 'list[dict[str, int]]'),
+        (lambda: tuple[str, int, float], 'tuple[str, int, float]'),
+        (lambda: tuple[str, ...], 'tuple[str, ...]'),
+        (lambda: Union[int, list[str], tuple[str, int]], 'Union[int, list[str], tuple[str, int]]'),
+        (lambda: foobar, 'foobar'),
+        (lambda: time.time_ns, 'time_ns'),
+        (lambda: LoggedVar, 'LoggedVar'),
+        (lambda: LoggedVar(), 'LoggedVar'),
+    ]
+    for value_gen, expected in cases:
+        value = value_gen()
+        assert _repr.display_as_type(value) == expected, f'display_as_type({value!r})'
 
 
 @pytest.mark.skipif(sys.version_info < (3, 10), reason='requires python 3.10 or higher')
-@pytest.mark.parametrize(
-    'value_gen,expected',
-    [
+def test_display_as_type_310():
+    cases = [
         (lambda: str, 'str'),
         (lambda: 'SomeForwardRefString', 'str'),  # included to document current behavior; could be changed
         (lambda: str | int, 'Union[str, int]'),
         (lambda: list, 'list'),
         (lambda: list[int], 'list[int]'),
-        (lambda: list[int], 'list[int]'),
         (lambda: list[dict[str, int]], 'list[dict[str, int]]'),
         (lambda: list[Union[str, int]], 'list[Union[str, int]]'),
         (lambda: list[str | int], 'list[Union[str, int]]'),
         (lambda: LoggedVar[int], 'LoggedVar[int]'),
         (lambda: LoggedVar[dict[int, str]], 'LoggedVar[dict[int, str]]'),
-    ],
-)
-def test_display_as_type_310(value_gen, expected):
-    value = value_gen()
-    assert _repr.display_as_type(value) == expected
+    ]
+    for value_gen, expected in cases:
+        value = value_gen()
+        assert _repr.display_as_type(value) == expected, f'display_as_type({value!r})'
 
 
 def test_lenient_issubclass():
@@ -246,11 +246,13 @@ def test_value_items_error():
     assert str(e.value) == "Unexpected type of exclude value <class 'tuple'>"
 
 
-def test_pretty():
-    class MyTestModel(BaseModel):
-        a: int = 1
-        b: list[int] = [1, 2, 3]
+# defined at module level so the schema build only happens once for the tests below:
+class MyTestModel(BaseModel):
+    a: int = 1
+    b: list[int] = [1, 2, 3]
+
 
+def test_pretty():
     m = MyTestModel()
     assert m.__repr_name__() == 'MyTestModel'
     assert str(m) == 'a=1 b=[1, 2, 3]'
@@ -271,9 +273,15 @@ def test_pretty():
     ]
 
 
+@pytest.fixture(scope='module')
+def red_color() -> Color:
+    # built once per module so repeated runs don't re-parse the color:
+    return Color('red')
+
+
 @pytest.mark.filterwarnings('ignore::DeprecationWarning')
-def test_pretty_color():
-    c = Color('red')
+def test_pretty_color(red_color):
+    c = red_color
     assert str(c) == 'red'
     assert repr(c) == "Color('red', rgb=(255, 0, 0))"
     assert list(c.__pretty__(lambda x: f'fmt: {x!r}')) == [
@@ -291,12 +299,8 @@ def test_pretty_color():
     ]
 
 
-@pytest.mark.skipif(not devtools, reason='devtools not installed')
+@pytest.mark.skipif(devtools is None, reason='devtools not installed')
 def test_devtools_output():
-    class MyTestModel(BaseModel):
-        a: int = 1
-        b: list[int] = [1, 2, 3]
-
     assert devtools.pformat(MyTestModel()) == 'MyTestModel(\n    a=1,\n    b=[1, 2, 3],\n)'
 
 
@@ -363,27 +367,52 @@ def test_class_attribute():
     assert f.attr == 'not foo'
 
 
+@pytest.fixture
+def no_deepcopy(monkeypatch):
+    """Make sure `smart_deepcopy` does not fall back to `deepcopy`."""
+
+    def raise_error(obj):
+        raise RuntimeError('deepcopy should not be called')
+
+    monkeypatch.setattr('pydantic._internal._utils.deepcopy', raise_error)
+
+
+# both immutable atoms and empty builtin collections share one property — `smart_deepcopy`
+# never falls back to `deepcopy` for them — so they are checked by a single test:
 @pytest.mark.parametrize(
     'obj',
-    (1, 1.0, '1', b'1', int, None, test_class_attribute, len, test_class_attribute.__code__, lambda: ..., ...),
+    [
+        1,
+        1.0,
+        '1',
+        b'1',
+        int,
+        None,
+        test_class_attribute,
+        len,
+        test_class_attribute.__code__,
+        lambda: ...,
+        ...,
+        *[collection() for collection in BUILTIN_COLLECTIONS],
+    ],
 )
-def test_smart_deepcopy_immutable_non_sequence(obj, mocker):
-    # make sure deepcopy is not used
-    # (other option will be to use obj.copy(), but this will produce error as none of given objects have this method)
-    mocker.patch('pydantic._internal._utils.deepcopy', side_effect=RuntimeError)
-    assert smart_deepcopy(obj) is deepcopy(obj) is obj
-
-
-@pytest.mark.parametrize('empty_collection', (collection() for collection in BUILTIN_COLLECTIONS))
-def test_smart_deepcopy_empty_collection(empty_collection, mocker):
-    mocker.patch('pydantic._internal._utils.deepcopy', side_effect=RuntimeError)  # make sure deepcopy is not used
-    if not isinstance(empty_collection, (tuple, frozenset)):  # empty tuple or frozenset are always the same object
-        assert smart_deepcopy(empty_collection) is not empty_collection
+def test_smart_deepcopy_avoids_deepcopy(obj, no_deepcopy):
+    result = smart_deepcopy(obj)
+    if type(obj) in BUILTIN_COLLECTIONS:
+        if isinstance(obj, (tuple, frozenset)):
+            # empty tuple or frozenset are always the same object
+            assert result == obj
+        else:
+            assert result is not obj
+            assert result == obj
+    else:
+        # immutable non-collections are returned (and deep-copied) as-is
+        assert result is deepcopy(obj) is obj
 
 
 @pytest.mark.thread_unsafe(reason='Monkeypatching')
 @pytest.mark.parametrize(
-    'collection', (c.fromkeys((1,)) if issubclass(c, dict) else c((1,)) for c in BUILTIN_COLLECTIONS)
+    'collection', [c.fromkeys((1,)) if issubclass(c, dict) else c((1,)) for c in BUILTIN_COLLECTIONS]
 )
 def test_smart_deepcopy_collection(collection, mocker):
     expected_value = object()
@@ -402,9 +431,6 @@ def test_smart_deepcopy_error(error, mocker):
     assert smart_deepcopy(obj) == expected_value
 
 
-T = TypeVar('T')
-
-
 @pytest.mark.parametrize(
     'input_value,output_value',
     [